@@ -16,13 +16,15 @@
 
 from __future__ import annotations
 
-from inspect import getfullargspec
-from typing import Any, TypeVar
+import functools as ft
+from inspect import Parameter
+from typing import Any, Callable, TypeVar
 
 import jax
 
 import serket as sk
 from serket._src.utils.dispatch import single_dispatch
+from serket._src.utils.inspect import get_params
 
 T = TypeVar("T")
 
@@ -94,44 +96,55 @@ def tree_state(tree: T, **kwargs) -> T:
     # input. This poses a challenge for the user to pass the correct input
     # to the state initialization rule.
 
-    types = tuple(set(tree_state.dispatcher.registry) - {object})
+    is_leaf = make_is_leaf(tree_state.dispatcher.registered_types())
+    leaves, treedef = jax.tree_util.tree_flatten(tree, is_leaf=is_leaf)
+    leaves = [state_dispatch_func(leaf, **kwargs) for leaf in leaves]
+    return jax.tree_util.tree_unflatten(treedef, leaves)
 
+
+@ft.lru_cache(maxsize=None)
+def make_is_leaf(types: tuple[type, ...]) -> Callable[[Any], bool]:
     def is_leaf(node: Any) -> bool:
         return isinstance(node, types)
 
-    def dispatch_func(leaf):
-        try:
-            return tree_state.dispatcher(leaf, **kwargs)
+    return is_leaf
+
 
-        except TypeError as e:
-            # check if the leaf has a state rule
+@ft.lru_cache(maxsize=None)
+def get_rule_kwargs(func) -> tuple[frozenset[str] | None, tuple[str, ...]]:
+    # names of the keyword arguments accepted by a state rule after the layer
+    # argument (``None`` if it accepts ``**kwargs``), and the required ones
+    params = get_params(func)[1:]
+    kinds = (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+    names = frozenset(param.name for param in params if param.kind in kinds)
+    if any(param.kind == Parameter.VAR_KEYWORD for param in params):
+        names = None
+    required = tuple(
+        param.name
+        for param in params
+        if param.kind in kinds and param.default is Parameter.empty
+    )
+    return names, required
 
-            for mro in type(leaf).__mro__[:-1]:
-                if mro in (registry := tree_state.dispatcher.registry):
-                    func = registry[mro]
-                    break
-            else:
-                # no state rule is registered for this leaf
-                # however type error is raised for other reasons
-                raise type(e)(e)
 
-            # the state rule is registered and the kwargs passed to `tree_state`
-            # check if all necessary kwargs for this state rule are passed
-            state_kwargs = getfullargspec(func).kwonlyargs
+def state_dispatch_func(leaf, **kwargs):
+    func = tree_state.dispatcher.dispatch(type(leaf))
+    names, required = get_rule_kwargs(func)
 
-            if set(state_kwargs).issubset(set(kwargs)):
-                # the state rule is registered and the kwargs passed to `tree_state`
-                return func(leaf, **{key: kwargs[key] for key in state_kwargs})
+    if missing := [name for name in required if name not in kwargs]:
+        # the state rule is registered, however the kwargs needed by the
+        # state rule are not passed to `tree_state`
+        raise TypeError(
+            f"{type(leaf)=} has a registered state rule {sk.tree_str(func)}."
+            f"\nHowever, the kwargs = {','.join(missing)} "
+            "are not passed to the state rule."
+        )
 
-            # the state rule is registered and the kwargs passed to `tree_state`
-            # are not a subset of the kwargs needed by the state rule (not found)
-            raise type(e)(
-                f"{type(leaf)=} has a registered state rule {sk.tree_str(func)}."
-                f"\nHowever, the  kwargs = {','.join(set(kwargs)-set(state_kwargs))}"
-                f"are not passed to the state rule.\n{e}"
-            )
+    if names is not None:
+        # pass only the kwargs accepted by the state rule
+        kwargs = {key: value for key, value in kwargs.items() if key in names}
 
-    return jax.tree_util.tree_map(dispatch_func, tree, is_leaf=is_leaf)
+    return func(leaf, **kwargs)
 
 
 tree_state.dispatcher = single_dispatch(argnum=0)(NoState)
@@ -197,12 +210,10 @@ def tree_eval(tree):
          [1. 1. 1.]]
     """
 
-    types = tuple(set(tree_eval.dispatcher.registry) - {object})
-
-    def is_leaf(node: Any) -> bool:
-        return isinstance(node, types)
-
-    return jax.tree_util.tree_map(tree_eval.dispatcher, tree, is_leaf=is_leaf)
+    is_leaf = make_is_leaf(tree_eval.dispatcher.registered_types())
+    leaves, treedef = jax.tree_util.tree_flatten(tree, is_leaf=is_leaf)
+    leaves = [tree_eval.dispatcher(leaf) for leaf in leaves]
+    return jax.tree_util.tree_unflatten(treedef, leaves)
 
 
 tree_eval.dispatcher = single_dispatch(argnum=0)(lambda x: x)
@@ -43,7 +43,7 @@ def horizontal_flip_2d(image: HWArray) -> HWArray:
 
 
 def random_horizontal_flip_2d(key: jax.Array, image: HWArray, rate: float) -> HWArray:
-    prop = jr.bernoulli(key, rate)
+    prop = jr.uniform(key) < rate
     return jnp.where(prop, horizontal_flip_2d(image), image)
 
 
@@ -53,7 +53,7 @@ def vertical_flip_2d(image: HWArray) -> HWArray:
 
 
 def random_vertical_flip_2d(key: jax.Array, image: HWArray, rate: float) -> HWArray:
-    prop = jr.bernoulli(key, rate)
+    prop = jr.uniform(key) < rate
     return jnp.where(prop, vertical_flip_2d(image), image)
 
 
@@ -35,6 +35,11 @@ from serket._src.utils.validate import (
 )
 
 
+def is_zero_rate(drop_rate) -> bool:
+    # a concrete zero rate is the identity, no mask needs to be drawn
+    return isinstance(drop_rate, (int, float)) and drop_rate == 0
+
+
 def dropout_nd(
     key: jax.Array,
     input: jax.Array,
@@ -49,17 +54,24 @@ def dropout_nd(
         drop_rate: probability of an element to be zeroed.
         drop_axes: axes to apply dropout. Default: None to apply to all axes.
     """
+    if is_zero_rate(drop_rate):
+        return input.astype(jnp.result_type(input, float))
+
+    # mask shape, with size-1 axes broadcasting over the axes not dropped
     shape = (
         input.shape
         if drop_axes is None
-        else (input.shape[i] if i in drop_axes else 1 for i in range(input.ndim))
+        else tuple(input.shape[i] if i in drop_axes else 1 for i in range(input.ndim))
     )
 
-    return jnp.where(
-        (keep_prop := (1 - drop_rate)) == 0.0,
-        jnp.zeros_like(input),
-        jnp.where(jr.bernoulli(key, keep_prop, shape=shape), input / keep_prop, 0),
-    )
+    keep_prop = 1 - drop_rate
+    # scale the kept entries of the (possibly broadcastable) mask, then multiply
+    # instead of selecting over the full input. the scalar guard keeps the
+    # ``keep_prop == 0`` case at zeros instead of ``0 * inf``
+    inv_keep_prop = jnp.where(keep_prop == 0, 0, jnp.divide(1, keep_prop))
+    # same draw as ``jr.bernoulli`` without its parameter broadcasting checks
+    mask = jr.uniform(key, shape=shape) < keep_prop
+    return input * (mask.astype(jnp.result_type(input, float)) * inv_keep_prop)
 
 
 def random_cutout_nd(
@@ -156,6 +168,10 @@ class Dropout(TreeClass):
             x: input array
             key: random number generator key
         """
+        # check the stored rate, the ``drop_rate`` getattr hook returns a
+        # tracer under ``jax.jit`` even when the layer is closed over
+        if is_zero_rate(vars(self)["drop_rate"]):
+            return input.astype(jnp.result_type(input, float))
         return dropout_nd(key, input, self.drop_rate, self.drop_axes)
 
 
@@ -175,6 +191,10 @@ class DropoutND(TreeClass):
             input: input array
             key: random number generator key
         """
+        # check the stored rate, the ``drop_rate`` getattr hook returns a
+        # tracer under ``jax.jit`` even when the layer is closed over
+        if is_zero_rate(vars(self)["drop_rate"]):
+            return input.astype(jnp.result_type(input, float))
         return dropout_nd(key, input, self.drop_rate, (0,))
 
     @property
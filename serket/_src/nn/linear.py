@@ -34,11 +34,12 @@ from serket._src.utils.typing import Batched, DType, InitType
 from serket._src.utils.validate import validate_pos_int
 
 
+@ft.lru_cache(maxsize=None)
 def generate_einsum_pattern(
     lhs_ndim: int,
     rhs_ndim: int,
-    in_axis: Sequence[int],
-    out_axis: Sequence[int],
+    in_axis: tuple[int, ...],
+    out_axis: tuple[int, ...],
 ) -> tuple[str, str, str]:
     # helper function to generate the einsum pattern for linear layer
     # with flexible input and output axes
@@ -76,12 +77,34 @@ def linear(
         in_axis: axes to apply the linear layer to.
         out_axis: result axis.
     """
+    in_axis, out_axis = tuple(in_axis), tuple(out_axis)
     lhs, rhs, out = generate_einsum_pattern(input.ndim, weight.ndim, in_axis, out_axis)
-    result = jnp.einsum(f"{lhs},{rhs}->{out}", input, weight)
+
+    if (dtype := jnp.result_type(input, weight)) in (jnp.float16, jnp.bfloat16):
+        # accumulate half precision contractions in float32
+        result = jnp.einsum(
+            f"{lhs},{rhs}->{out}",
+            input,
+            weight,
+            preferred_element_type=jnp.float32,
+        ).astype(dtype)
+    else:
+        result = jnp.einsum(f"{lhs},{rhs}->{out}", input, weight)
 
     if bias is None:
         return result
 
+    out_axis = [axis if axis >= 0 else axis + result.ndim for axis in out_axis]
+
+    if out_axis == sorted(out_axis):
+        # bias axes follow the output axes order (e.g. the default ``out_axis=-1``)
+        # a reshape broadcast is enough and keeps the add directly after the dot
+        # for the compiler to fuse it with the contraction
+        shape = [1] * result.ndim
+        for axis, dim in zip(out_axis, bias.shape):
+            shape[axis] = dim
+        return result + bias.reshape(shape)
+
     bias = bias.reshape(*bias.shape, *[1] * (result.ndim - bias.ndim))
     bias = jnp.einsum(f"{''.join(sorted(out))}->{out}", bias)
     return result + bias
@@ -292,12 +315,13 @@ def scan_linear(
         output, _ = jax.lax.scan(scan_func, input, weight)
         return output
 
-    def scan_func(input: jax.Array, weight_bias: Batched[jax.Array]):
-        weight, bias = weight_bias[..., :-1], weight_bias[..., -1]
+    def scan_func(input: jax.Array, weight_bias: tuple[jax.Array, jax.Array]):
+        weight, bias = weight_bias
         return act(linear(input, weight, bias)), None
 
-    weight_bias = jnp.concatenate([weight, bias[:, :, None]], axis=-1)
-    output, _ = jax.lax.scan(scan_func, input, weight_bias)
+    # scan over the stacked pair directly instead of concatenating a new
+    # (num_layers, out, in + 1) array on every call
+    output, _ = jax.lax.scan(scan_func, input, (weight, bias))
     return output
 
 
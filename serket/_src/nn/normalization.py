@@ -35,6 +35,57 @@ from serket._src.utils.validate import (
 )
 
 
+def canonicalize_axis(ndim: int, axis: int) -> int:
+    if not -ndim <= axis < ndim:
+        raise IndexError(f"{axis=} is out of bounds for an input with {ndim=}.")
+    return axis % ndim
+
+
+@ft.lru_cache(maxsize=128)
+def calculate_reduction_axes(ndim: int, axis: int) -> tuple[int, ...]:
+    # all axes except the feature axis
+    axis = canonicalize_axis(ndim, axis)
+    return tuple(i for i in range(ndim) if i != axis)
+
+
+@ft.lru_cache(maxsize=128)
+def calculate_broadcast_shape(ndim: int, axis: int, size: int) -> tuple[int, ...]:
+    # shape to broadcast a feature vector of ``size`` along ``axis``
+    axis = canonicalize_axis(ndim, axis)
+    return (1,) * axis + (size,) + (1,) * (ndim - axis - 1)
+
+
+def calculate_norm_dtypes(dtype) -> tuple[jnp.dtype, jnp.dtype]:
+    # accumulate the statistics in (at least) float32 for half precision inputs,
+    # and normalize in the input precision (or the statistics one for integers)
+    stats_dtype = jnp.promote_types(dtype, jnp.float32)
+    dtype = dtype if jnp.issubdtype(dtype, jnp.inexact) else stats_dtype
+    return stats_dtype, dtype
+
+
+def calculate_mean_var(
+    input: jax.Array,
+    axes: int | tuple[int, ...],
+    stats_dtype: jnp.dtype,
+    axis_name: str | None = None,
+) -> tuple[jax.Array, jax.Array]:
+    # mean and variance over ``axes`` (kept as size-1 dims) in ``stats_dtype``.
+    # center the input before squaring, `E[x^2] - E[x]^2` cancels badly when the
+    # mean is large relative to the spread. the mean of the centered input is the
+    # rounding error of the first mean, add it back and remove it from the variance
+    # (corrected two-pass), it reduces alongside the variance in the same pass.
+    def mean(x):
+        x = jnp.mean(x, axis=axes, keepdims=True)
+        return x if axis_name is None else jax.lax.pmean(x, axis_name)
+
+    input = input.astype(stats_dtype)
+    μ = mean(input)
+    centered = input - μ
+    δ = mean(centered)
+    σ_2 = mean(centered * centered) - δ * δ
+    return μ + δ, σ_2
+
+
 def layer_norm(
     input: jax.Array,
     weight: jax.Array | None,
@@ -60,12 +111,13 @@ def layer_norm(
     assert normalized_shape == input.shape[-len(normalized_shape) :]
     axes = tuple(range(len(input.shape) - len(normalized_shape), len(input.shape)))
     eps = jnp.finfo(input.dtype).eps if eps is None else eps
-    μ = jnp.mean(input, axis=axes, keepdims=True)
-    σ_2 = jnp.var(input, axis=axes, keepdims=True)
-    output = (input - μ) * jax.lax.rsqrt((σ_2 + eps))
-    output = output if weight is None else output * weight
-    output = output if bias is None else output + bias
-    return output
+    stats_dtype, dtype = calculate_norm_dtypes(input.dtype)
+    μ, σ_2 = calculate_mean_var(input, axes, stats_dtype)
+    # fold the scale into the normalization factor to emit one multiply-add
+    scale = jax.lax.rsqrt(σ_2 + eps).astype(dtype)
+    scale = scale if weight is None else scale * weight
+    output = (input - μ.astype(dtype)) * scale
+    return output if bias is None else output + bias
 
 
 def group_norm(
@@ -85,17 +137,33 @@ def group_norm(
         groups: number of groups to separate the features into.
     """
     # split channels into groups
-    shape = input.shape
-    axes = tuple(range(1, input.ndim))
-    input = input.reshape(groups, -1)
+    in_features = input.shape[0]
+    if in_features % groups != 0:
+        raise ValueError(f"{in_features=} must be divisible by {groups=}.")
+    broadcast_shape = calculate_broadcast_shape(input.ndim, 0, in_features)
+    stats_dtype, dtype = calculate_norm_dtypes(input.dtype)
+    if groups == in_features:
+        # instance norm: each channel is a group, reduce over the non-channel
+        # axes directly instead of reshaping to (groups, -1)
+        grouped = input
+        axes = calculate_reduction_axes(input.ndim, 0)
+    else:
+        grouped = input.reshape(groups, -1)
+        axes = -1
     # calculate mean and variance over each group
-    μ = jnp.mean(input, axis=-1, keepdims=True)
-    σ_2 = jnp.var(input, axis=-1, keepdims=True)
-    output = (input - μ) * jax.lax.rsqrt((σ_2 + eps))
-    output = output.reshape(*shape)
-    output = output if weight is None else output * jnp.expand_dims(weight, axis=axes)
-    output = output if bias is None else output + jnp.expand_dims(bias, axis=axes)
-    return output
+    μ, σ_2 = calculate_mean_var(grouped, axes, stats_dtype)
+    μ, σ_2 = jnp.squeeze(μ, axis=axes).astype(dtype), jnp.squeeze(σ_2, axis=axes)
+    scale = jax.lax.rsqrt(σ_2 + eps).astype(dtype)
+    if groups != in_features:
+        # expand the group statistics to per-channel statistics
+        μ = jnp.repeat(μ, in_features // groups)
+        scale = jnp.repeat(scale, in_features // groups)
+    scale = scale if weight is None else scale * weight
+    μ, scale = μ.reshape(broadcast_shape), scale.reshape(broadcast_shape)
+    # per-channel mean and scale, so the normalization and the affine transform
+    # become a single elementwise op on the input without reshaping back
+    output = (input - μ) * scale
+    return output if bias is None else output + bias.reshape(broadcast_shape)
 
 
 def instance_norm(
@@ -450,23 +518,20 @@ def batch_norm(
         - ``running_mean``
         - ``running_var``
     """
-    broadcast_shape = [1] * input.ndim
-    broadcast_shape[axis] = input.shape[axis]
-    axes = list(range(input.ndim))
-    with jax.ensure_compile_time_eval():
-        del axes[axis]
-    batch_mean = jnp.mean(input, axis=axes, keepdims=True)
-    if axis_name is not None:
-        batch_mean = jax.lax.pmean(batch_mean, axis_name)
-    batch_var = jnp.mean(jnp.square(input), axis=axes, keepdims=True)
-    batch_var -= batch_mean**2
-    if axis_name is not None:
-        batch_var = jax.lax.pmean(batch_var, axis_name)
-    output = (input - batch_mean) / jnp.sqrt(batch_var + eps)
+    broadcast_shape = calculate_broadcast_shape(input.ndim, axis, input.shape[axis])
+    weight = None if weight is None else jnp.reshape(weight, broadcast_shape)
+    bias = None if bias is None else jnp.reshape(bias, broadcast_shape)
+    axes = calculate_reduction_axes(input.ndim, axis)
+    stats_dtype, dtype = calculate_norm_dtypes(input.dtype)
+    batch_mean, batch_var = calculate_mean_var(input, axes, stats_dtype, axis_name)
+    scale = jax.lax.rsqrt(batch_var + eps)
+    scale = scale if weight is None else scale * weight
+    # fold the weight into a per-feature ``scale`` so the output is a single
+    # elementwise op per element
+    output = (input - batch_mean.astype(dtype)) * scale.astype(dtype)
+    output = output if bias is None else output + bias
     running_mean = momentum * running_mean + (1 - momentum) * jnp.squeeze(batch_mean)
     running_var = momentum * running_var + (1 - momentum) * jnp.squeeze(batch_var)
-    output = output if weight is None else output * jnp.reshape(weight, broadcast_shape)
-    output = output if bias is None else output + jnp.reshape(bias, broadcast_shape)
     return output, running_mean, running_var
 
 
@@ -504,13 +569,17 @@ def eval_batch_norm(
         - ``running_var``
     """
     del momentum, axis_name
-    broadcast_shape = [1] * input.ndim
-    broadcast_shape[axis] = input.shape[axis]
-    running_mean = jnp.reshape(running_mean, broadcast_shape)
-    running_var = jnp.reshape(running_var, broadcast_shape)
-    output = (input - running_mean) * jax.lax.rsqrt(running_var + eps)
-    output = output if weight is None else output * jnp.reshape(weight, broadcast_shape)
-    output = output if bias is None else output + jnp.reshape(bias, broadcast_shape)
+    broadcast_shape = calculate_broadcast_shape(input.ndim, axis, input.shape[axis])
+    weight = None if weight is None else jnp.reshape(weight, broadcast_shape)
+    bias = None if bias is None else jnp.reshape(bias, broadcast_shape)
+    mean = jnp.reshape(running_mean, broadcast_shape)
+    var = jnp.reshape(running_var, broadcast_shape)
+    scale = jax.lax.rsqrt(var + eps)
+    scale = scale if weight is None else scale * weight
+    # subtract the mean before scaling, ``input * scale`` overflows in
+    # half precision for large activations
+    output = (input - mean) * scale
+    output = output if bias is None else output + bias
     return output, running_mean, running_var
 
 
@@ -695,6 +764,9 @@ class BatchNorm(TreeClass):
     ) -> tuple[jax.Array, BatchNormState]:
         # simplify the call signature to avoid forcing the user to
         # to use a long `in_axes` and `out_axes` argument
+        # NOTE: the `custom_vmap` wrapper is needed even if `axis_name` is None,
+        # the batch statistics are reduced over the vmapped axis which is only
+        # visible to the vmap rule and not to the per-example function.
         batch_norm_impl = custom_vmap(lambda input, state: (input, state))
         momentum, eps = jax.lax.stop_gradient((self.momentum, self.eps))
 
@@ -875,9 +947,8 @@ def weight_norm(leaf: T, axis: int | None = -1, eps: float = 1e-12) -> T:
     """
     if not (hasattr(leaf, "ndim") and hasattr(leaf, "shape")):
         return leaf
+    reduction_axes = None
     if axis is not None:
-        reduction_axes = list(range(leaf.ndim))
-        with jax.ensure_compile_time_eval():
-            del reduction_axes[axis]
-    ssum = jnp.sum(jnp.square(leaf), axis=reduction_axes, keepdims=True)
+        reduction_axes = calculate_reduction_axes(leaf.ndim, axis)
+    ssum = jnp.sum(leaf * leaf, axis=reduction_axes, keepdims=True)
     return leaf * jax.lax.rsqrt(ssum + eps)
@@ -19,6 +19,7 @@ import functools as ft
 from typing import Sequence
 
 import jax
+import jax.numpy as jnp
 import jax.random as jr
 
 from serket import TreeClass
@@ -47,11 +48,10 @@ def random_crop_nd(
         input: input array.
         crop_size: size of the crop along each axis.Accepts a tuple of int.
     """
-    start: tuple[int, ...] = tuple(
-        jr.randint(key, shape=(), minval=0, maxval=input.shape[i] - s)
-        for i, s in enumerate(crop_size)
-    )
-    return jax.lax.dynamic_slice(input, start, crop_size)
+    # draw all the starts at once, so each axis gets an independent start
+    maxval = tuple(input.shape[i] - s + 1 for i, s in enumerate(crop_size))
+    start = jr.randint(key, shape=(len(crop_size),), minval=0, maxval=jnp.array(maxval))
+    return jax.lax.dynamic_slice(input, tuple(start), crop_size)
 
 
 def center_crop_nd(input: jax.Array, sizes: tuple[int, ...]) -> jax.Array:
@@ -63,7 +63,9 @@ def center_crop_nd(input: jax.Array, sizes: tuple[int, ...]) -> jax.Array:
     """
     shapes = input.shape
     starts = tuple(max(shape // 2 - size // 2, 0) for shape, size in zip(shapes, sizes))
-    return jax.lax.dynamic_slice(input, starts, sizes)
+    # the starts depend only on static shapes, so a static slice suffices
+    limits = tuple(start + size for start, size in zip(starts, sizes))
+    return jax.lax.slice(input, starts, limits)
 
 
 def extract_patches(
@@ -187,9 +189,8 @@ class UpsampleND(TreeClass):
 
     @ft.partial(validate_spatial_ndim, argnum=0)
     def __call__(self, input: jax.Array) -> jax.Array:
-        in_axes = (0, None, None)
-        args = (input, self.scale, self.method)
-        return jax.vmap(upsample_nd, in_axes=in_axes)(*args)
+        # resize the whole input at once, keeping the channel axis as is
+        return upsample_nd(input, (1, *self.scale), self.method)
 
     @property
     @abc.abstractmethod
@@ -351,7 +352,7 @@ class CenterCropND(TreeClass):
 
     @ft.partial(validate_spatial_ndim, argnum=0)
     def __call__(self, input: jax.Array) -> jax.Array:
-        return jax.vmap(ft.partial(center_crop_nd, sizes=self.size))(input)
+        return center_crop_nd(input, sizes=(input.shape[0], *self.size))
 
     @property
     @abc.abstractmethod
@@ -31,7 +31,8 @@ def canonicalize(value, ndim, name: str | None = None):
     if isinstance(value, Sequence):
         if len(value) != ndim:
             raise ValueError(f"{len(value)=} != {ndim=} for {name=} and {value=}.")
-        return value
+        # store as a tuple so the result is hashable (e.g. for ``lru_cache``)
+        return tuple(value)
     raise TypeError(f"Expected int or tuple for {name}, got {value=}.")
 
 
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import functools as ft
+from typing import Callable
 
 from serket._src.utils.inspect import get_params
 
@@ -24,6 +25,17 @@ def single_dispatch(argnum: int):
 
     def decorator(func):
         dispatcher = ft.singledispatch(func)
+        # resolved rule per type, cleared on registration. most dispatched
+        # types (e.g. arrays, ints) hit the ``object`` fallback, so skip the
+        # singledispatch lookup for types seen before
+        dispatch_cache: dict[type, Callable] = {}
+
+        def dispatch(klass: type) -> Callable:
+            try:
+                return dispatch_cache[klass]
+            except KeyError:
+                impl = dispatch_cache[klass] = dispatcher.dispatch(klass)
+                return impl
 
         @ft.wraps(func)
         def wrapper(*args, **kwargs):
@@ -32,10 +44,37 @@ def single_dispatch(argnum: int):
             except IndexError:
                 argname = get_params(func)[argnum].name
                 klass = type(kwargs[argname])
-            return dispatcher.dispatch(klass)(*args, **kwargs)
+            return dispatch(klass)(*args, **kwargs)
+
+        def clear_caches() -> None:
+            dispatch_cache.clear()
+            registered_types.cache_clear()
+
+        def def_type(klass, impl: Callable | None = None):
+            """Register a rule, accepts the same call forms as ``register``."""
+            registered = dispatcher.register(klass, impl)
+            if impl is None and registered is not klass:
+                # ``def_type(klass)`` returns a decorator that registers later,
+                # clear the caches only after the actual registration
+                def decorator(impl: Callable) -> Callable:
+                    impl = registered(impl)
+                    clear_caches()
+                    return impl
+
+                return decorator
+            # ``def_type(klass, impl)`` or an annotated ``def_type(impl)``
+            clear_caches()
+            return registered
+
+        @ft.lru_cache(maxsize=None)
+        def registered_types() -> tuple[type, ...]:
+            """Types with a registered rule, excluding the ``object`` fallback."""
+            return tuple(set(dispatcher.registry) - {object})
 
-        wrapper.def_type = dispatcher.register
+        wrapper.dispatch = dispatch
+        wrapper.def_type = def_type
         wrapper.registry = dispatcher.registry
+        wrapper.registered_types = registered_types
         ft.update_wrapper(wrapper, func)
         return wrapper
 
@@ -38,6 +38,25 @@ def test_dropout():
         sk.nn.Dropout(-0.1)
 
 
+def test_dropout_zero_rate_skips_mask():
+    x = jnp.ones([4, 4])
+    # no mask is drawn for a concrete zero rate, so no key is needed
+    npt.assert_allclose(sk.nn.Dropout(0.0)(x), x)
+    npt.assert_allclose(sk.nn.Dropout1D(0.0)(x), x)
+    # the rate stays concrete when the layer is closed over in jit
+    npt.assert_allclose(jax.jit(lambda x: sk.nn.Dropout(0.0)(x))(x), x)
+    npt.assert_allclose(jax.jit(lambda x: sk.nn.Dropout1D(0.0)(x))(x), x)
+
+
+def test_dropout_nd_channel_mask():
+    x = jnp.ones([8, 3, 3])
+    output = sk.nn.Dropout2D(0.5)(x, key=jax.random.PRNGKey(0))
+    # each channel is either dropped or scaled by ``1 / (1 - drop_rate)``
+    channel_values = output.reshape(8, -1)
+    npt.assert_allclose(channel_values, channel_values[:, :1].repeat(9, axis=1))
+    assert set(channel_values[:, 0].tolist()) <= {0.0, 2.0}
+
+
 def test_random_cutout_1d():
     layer = sk.nn.RandomCutout1D(3, 1)
     x = jnp.ones((1, 10))
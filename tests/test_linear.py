@@ -207,3 +207,28 @@ def test_mlp_bias():
     layer = layer.at["out_bias"].set(b3)
 
     npt.assert_allclose(layer(x), y)
+
+
+@pytest.mark.parametrize("out_axis", [(0, 1), (1, 0), (-1, 0), (0, -1)])
+def test_linear_bias_broadcast(out_axis):
+    x = jax.random.normal(jax.random.PRNGKey(0), (3, 4))
+    weight = jax.random.normal(jax.random.PRNGKey(1), (5, 6, 4))
+    bias = jax.random.normal(jax.random.PRNGKey(2), (5, 6))
+    out = sk.nn.linear(x, weight, bias, in_axis=(-1,), out_axis=out_axis)
+    # reference: move the output axes to the front in `out_axis` order
+    ndim = out.ndim
+    front = [a % ndim for a in out_axis]
+    true = jnp.einsum("bi,ofi->ofb", x, weight) + bias[:, :, None]
+    npt.assert_allclose(jnp.moveaxis(out, front, [0, 1]), true, atol=1e-5)
+
+
+@pytest.mark.parametrize("dtype", [jnp.float16, jnp.bfloat16])
+def test_linear_half_precision(dtype):
+    layer = sk.nn.Linear(64, 3, key=jax.random.PRNGKey(0))
+    layer = layer.at["weight"].set(layer.weight.astype(dtype))
+    layer = layer.at["bias"].set(layer.bias.astype(dtype))
+    x = jax.random.normal(jax.random.PRNGKey(1), (2, 64)).astype(dtype)
+    out = layer(x)
+    assert out.dtype == dtype
+    true = x.astype(jnp.float32) @ layer.weight.T.astype(jnp.float32)
+    npt.assert_allclose(out.astype(jnp.float32), true, atol=5e-2, rtol=1e-2)
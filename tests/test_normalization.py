@@ -16,6 +16,7 @@ import os
 
 import jax
 import jax.numpy as jnp
+import numpy as np
 import numpy.testing as npt
 import pytest
 
@@ -285,3 +286,99 @@ def test_weight_norm_wrapper():
     true = jnp.array([[-0.51219565, 1.1655288, 0.19189113, -0.7554708]])
     pred = linear(jnp.ones((1, 2)))
     npt.assert_allclose(true, pred, atol=1e-5)
+
+
+def test_weight_norm_axis_none():
+    weight = jnp.arange(1, 7, dtype=jnp.float32).reshape(2, 3)
+    true = weight / jnp.linalg.norm(weight)
+    npt.assert_allclose(sk.nn.weight_norm(weight, axis=None), true, atol=1e-6)
+
+
+def test_weight_norm_axis_out_of_bounds():
+    with pytest.raises(IndexError):
+        sk.nn.weight_norm(jnp.ones((2, 3)), axis=2)
+
+    with pytest.raises(IndexError):
+        sk.nn.weight_norm(jnp.ones((2, 3)), axis=-3)
+
+
+def test_batchnorm_no_cond():
+    # train/eval are selected statically, so no `cond` should be traced
+    bn = sk.nn.BatchNorm(5, axis=-1, key=jax.random.PRNGKey(0))
+    state = sk.tree_state(bn)
+    input = jnp.ones((4, 5))
+    kwargs = dict(in_axes=(0, None), out_axes=(0, None))
+
+    for layer in (bn, sk.tree_eval(bn)):
+        jaxpr = jax.make_jaxpr(jax.vmap(layer, **kwargs))(input, state)
+        assert "cond" not in str(jaxpr)
+
+
+def test_batchnorm_half_precision():
+    # `E[x^2]` overflows in float16 for these activations
+    bn = sk.nn.BatchNorm(3, axis=-1, key=jax.random.PRNGKey(0))
+    state = sk.tree_state(bn)
+    input = (1_000 + jnp.arange(12).reshape(4, 3)).astype(jnp.float16)
+    kwargs = dict(in_axes=(0, None), out_axes=(0, None))
+    output, state = jax.vmap(bn, **kwargs)(input, state)
+    assert not jnp.any(jnp.isnan(output))
+    npt.assert_allclose(jnp.mean(output, axis=0), 0, atol=1e-2)
+
+
+def test_eval_batchnorm_half_precision():
+    # `input * scale` overflows in float16 for a constant channel
+    input = jnp.full((4, 3), 255.0, dtype=jnp.float16)
+    running_mean = jnp.full((3,), 255.0, dtype=jnp.float16)
+    running_var = jnp.zeros((3,), dtype=jnp.float16)
+    output, *_ = sk.nn.eval_batch_norm(
+        input, running_mean, running_var, axis=1, eps=1e-5
+    )
+    assert output.dtype == jnp.float16
+    npt.assert_allclose(output, 0)
+
+
+def reference_norm(input, groups, eps):
+    # float64 group normalization reference over the non-channel axes
+    input = np.asarray(input, dtype=np.float64)
+    grouped = input.reshape(groups, -1)
+    μ = grouped.mean(axis=-1, keepdims=True)
+    σ_2 = grouped.var(axis=-1, keepdims=True)
+    return ((grouped - μ) / np.sqrt(σ_2 + eps)).reshape(input.shape)
+
+
+@pytest.mark.parametrize("offset", [0.0, 1e3, 3e3])
+def test_instance_norm_large_mean(offset):
+    # the variance is centered, so a large mean does not cancel the spread
+    input = jax.random.normal(jax.random.PRNGKey(1), (4, 8, 8)) + offset
+    layer = sk.nn.InstanceNorm(4, key=jax.random.PRNGKey(0))
+    true = reference_norm(input, groups=4, eps=layer.eps)
+    npt.assert_allclose(layer(input), true, atol=2e-3)
+
+
+@pytest.mark.parametrize("dtype,atol", [(jnp.float16, 1e-2), (jnp.bfloat16, 5e-2)])
+def test_norm_half_precision(dtype, atol):
+    key = jax.random.PRNGKey(0)
+    layers = [
+        (sk.nn.LayerNorm((8, 8), key=key, dtype=dtype), 4),
+        (sk.nn.GroupNorm(4, groups=2, key=key, dtype=dtype), 2),
+        (sk.nn.InstanceNorm(4, key=key, dtype=dtype), 4),
+    ]
+    x = jax.random.normal(jax.random.PRNGKey(1), (4, 8, 8)).astype(dtype)
+    for layer, groups in layers:
+        out = layer(x + 100)
+        assert out.dtype == dtype
+        assert not jnp.any(jnp.isnan(out))
+        # the reference is computed from the same half precision input
+        input = x + 10
+        true = reference_norm(input, groups=groups, eps=layer.eps)
+        npt.assert_allclose(np.asarray(layer(input), np.float64), true, atol=atol)
+
+
+@pytest.mark.parametrize("layer", [sk.nn.GroupNorm, sk.nn.InstanceNorm])
+def test_norm_half_precision_constant_channel(layer):
+    # ``scale`` approaches ``rsqrt(eps)`` for a constant channel, so scaling the
+    # uncentered input overflows float16 (e.g. a saturated image channel)
+    kwargs = dict(groups=3) if layer is sk.nn.GroupNorm else {}
+    layer = layer(3, key=jax.random.PRNGKey(0), dtype=jnp.float16, **kwargs)
+    output = layer(jnp.full((3, 8, 8), 255.0, dtype=jnp.float16))
+    npt.assert_allclose(output, jnp.zeros((3, 8, 8)))
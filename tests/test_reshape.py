@@ -48,6 +48,16 @@ def test_random_crop_3d():
     )
 
 
+def test_random_crop_independent_starts():
+    x = jnp.arange(36).reshape(6, 6)
+    keys = jax.random.split(jax.random.PRNGKey(0), 50)
+    crops = jax.vmap(lambda key: sk.nn.random_crop_nd(key, x, (3, 3)))(keys)
+    row_starts, col_starts = crops[:, 0, 0] // 6, crops[:, 0, 0] % 6
+    # starts along each axis are drawn independently over the full valid range
+    assert jnp.any(row_starts != col_starts)
+    assert set(row_starts.tolist()) == {0, 1, 2, 3}
+
+
 def test_upsample1d():
     assert sk.nn.Upsample1D(2)(jnp.ones([1, 2])).shape == (1, 4)
 
@@ -81,3 +91,9 @@ def test_center_crop(layer, shape, crop_shape):
     start = [0] + [1] * spatial_ndim
     end = [leading_dim] + [3] * spatial_ndim
     npt.assert_allclose(layer(3)(x), jax.lax.dynamic_slice(x, start, end))
+
+
+def test_crop_size_hashable():
+    layer = sk.nn.CenterCrop2D([3, 3])
+    assert layer.size == (3, 3)
+    assert hash(layer) == hash(sk.nn.CenterCrop2D((3, 3)))
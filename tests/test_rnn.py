@@ -217,3 +217,16 @@ def test_dense_cell():
     output, _ = sk.nn.scan_cell(cell)(input, state)
     # 1x10 @ 10x10 => 1x10
     npt.assert_allclose(output[-1], jnp.ones([10]) * 10.0)
+
+
+def test_tree_state_kwargs():
+    cell = sk.nn.ConvLSTM1DCell(2, 3, kernel_size=3, key=jr.PRNGKey(0))
+    # kwargs not accepted by a state rule are dropped
+    cells = [cell, sk.nn.LSTMCell(2, 3, key=jr.PRNGKey(0))]
+    state = sk.tree_state(cells, input=jnp.ones([2, 5]))
+    assert state[0].hidden_state.shape == (3, 5)
+    assert state[1].hidden_state.shape == (3,)
+
+    with pytest.raises(TypeError):
+        # `input` is required by the state rule
+        sk.tree_state(cell)
@@ -27,6 +27,7 @@ from serket._src.utils.convert import (
     resolve_string_padding,
     resolve_tuple_padding,
 )
+from serket._src.utils.dispatch import single_dispatch
 from serket._src.utils.validate import IsInstance, ScalarLike, validate_pos_int
 
 
@@ -85,6 +86,8 @@ def test_canonicalize():
     assert canonicalize((3, 3), 2) == (3, 3)
     assert canonicalize((3, 3, 3), 3) == (3, 3, 3)
     npt.assert_allclose(canonicalize(jax.numpy.array([1]), 2), jax.numpy.array([1, 1]))
+    assert canonicalize([3, 3], 2) == (3, 3)
+    assert hash(canonicalize([3, 3], 2)) == hash((3, 3))
 
     with pytest.raises(ValueError):
         canonicalize("", 3)
@@ -138,3 +141,54 @@ def test_lazy_call():
     with pytest.raises(RuntimeError):
         # calling a lazy layer
         layer(jax.numpy.ones([5, 5]))
+
+
+def test_single_dispatch_registered_types():
+    @single_dispatch(argnum=0)
+    def func(x):
+        return "default"
+
+    assert func.registered_types() == ()
+
+    @func.def_type(int)
+    def _(x):
+        return "int"
+
+    # registering a new type invalidates the cached types
+    assert func.registered_types() == (int,)
+    assert func(1) == "int"
+
+    @func.def_type(int)
+    def _(x):
+        return "new int"
+
+    # re-registering a type invalidates the cached rule
+    assert func(1) == "new int"
+    assert func(1.0) == "default"
+
+
+def test_single_dispatch_annotation_registration():
+    @single_dispatch(argnum=0)
+    def func(x):
+        return "default"
+
+    assert func(1) == "default"
+
+    @func.def_type
+    def _(x: int):
+        return "int"
+
+    # the annotated type is registered and the cached rule is invalidated
+    assert func.registered_types() == (int,)
+    assert func(1) == "int"
+
+
+def test_tree_eval_annotation_registration():
+    class A(sk.TreeClass):
+        pass
+
+    @sk.tree_eval.def_eval
+    def _(_: A) -> int:
+        return 1
+
+    assert sk.tree_eval([A()]) == [1]